@@ -6,7 +6,6 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SolisCloudAPI
 from .const import CONF_API_KEY, CONF_API_SECRET, CONF_INVERTER_SERIALS, DOMAIN
@@ -23,9 +22,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api_secret = entry.data[CONF_API_SECRET]
     inverter_serials = entry.data[CONF_INVERTER_SERIALS]
 
-    # Create API client
-    session = async_get_clientsession(hass)
-    api = SolisCloudAPI(api_key, api_secret, session)
+    # Create API client with its own keep-alive session so the 60s polling
+    # loop reuses one warm TLS connection instead of renegotiating each cycle.
+    api = SolisCloudAPI(api_key, api_secret)
 
     # Create coordinator
     coordinator = SolisCloudDataUpdateCoordinator(
@@ -34,8 +33,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         inverter_serials,
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data. Close the owned session if the refresh fails:
+    # unload never runs for a not-ready entry and each setup retry builds a
+    # fresh client, so the session would otherwise leak per attempt.
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await api.close()
+        raise
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -50,6 +55,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SolisCloudDataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id
+        )
+        await coordinator.api.close()
 
     return unload_ok
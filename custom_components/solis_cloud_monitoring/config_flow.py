@@ -23,6 +23,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Solis API error codes -> config flow error keys. Unknown codes (including
+# pure transport failures, which carry no code) fall back to cannot_connect.
+ERROR_CODE_MAP = {
+    "Z0001": "invalid_auth",
+}
+
 
 async def validate_api_credentials(
     hass: HomeAssistant, api_key: str, api_secret: str
@@ -93,10 +99,7 @@ class SolisCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             except SolisCloudAPIError as err:
                 _LOGGER.error("Failed to validate credentials: %s", err)
-                if "Z0001" in str(err):
-                    errors["base"] = "invalid_auth"
-                else:
-                    errors["base"] = "cannot_connect"
+                errors["base"] = ERROR_CODE_MAP.get(err.code, "cannot_connect")
             except Exception:
                 _LOGGER.exception("Unexpected error during setup")
                 errors["base"] = "unknown"
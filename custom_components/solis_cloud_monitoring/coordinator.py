@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 from typing import Any
 
+import orjson
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import SolisCloudAPI, SolisCloudAPIError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MANUFACTURER,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-inverter fields that only change on hardware/firmware swaps.
+_STATIC_FIELDS = ("model", "machine", "version")
+
 
 def _merge_station_detail(
     inverter_data: dict[str, Any], station_data: dict[str, Any] | None
@@ -51,63 +64,186 @@ class SolisCloudDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str,
         )
         self.api = api
         self.inverter_serials = inverter_serials
+        # Device registry info per serial, rebuilt only when the static fields
+        # change so the 16+ sensors of one inverter share a single dict.
+        self.device_info_by_serial: dict[str, dict[str, Any]] = {}
+        self._device_static: dict[str, tuple[Any, Any, Any]] = {}
+        # Payload fingerprints so unchanged cycles (all-zero nights) reuse the
+        # previous dict object instead of producing an equal-but-new one.
+        self._last_hash: dict[str, bytes] = {}
+        self._last_data: dict[str, dict[str, Any]] = {}
+        # Last known static fields per serial, so a detail payload that omits
+        # them does not degrade device info to "Unknown".
+        self._static_info: dict[str, dict[str, Any]] = {}
+
+    def _backfill_static_fields(
+        self, serial: str, inverter_data: dict[str, Any]
+    ) -> None:
+        """Memoize model/machine/version and reuse them when a poll omits one."""
+        cached = self._static_info.setdefault(serial, {})
+        for field in _STATIC_FIELDS:
+            value = inverter_data.get(field)
+            if value not in (None, ""):
+                cached[field] = value
+            elif field in cached:
+                inverter_data[field] = cached[field]
+
+    def _dedupe_unchanged(
+        self, serial: str, inverter_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Return the previous payload object when nothing changed."""
+        digest = hashlib.blake2b(
+            orjson.dumps(inverter_data, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).digest()
+        if digest == self._last_hash.get(serial):
+            return self._last_data[serial]
+
+        self._last_hash[serial] = digest
+        self._last_data[serial] = inverter_data
+        return inverter_data
+
+    def _adjust_update_interval(self, data: dict[str, dict[str, Any]]) -> None:
+        """Back off polling while every inverter reports itself offline.
+
+        Overnight the inverters return currentState=1 with constant zeros, so
+        polling at the daytime cadence only burns API quota and TLS work. The
+        first cycle that sees a non-offline state snaps straight back.
+        """
+        all_offline = all(
+            str(inverter.get("currentState")) == "1" for inverter in data.values()
+        )
+        interval = MAX_SCAN_INTERVAL if all_offline else DEFAULT_SCAN_INTERVAL
+        interval = max(MIN_SCAN_INTERVAL, min(interval, MAX_SCAN_INTERVAL))
+        if self.update_interval != interval:
+            _LOGGER.debug(
+                "Switching update interval to %ss (all inverters offline: %s)",
+                interval.total_seconds(),
+                all_offline,
+            )
+            self.update_interval = interval
+
+    def _refresh_device_info(
+        self, serial: str, inverter_data: dict[str, Any]
+    ) -> None:
+        """Rebuild the cached device_info when model/machine/version change."""
+        static = (
+            inverter_data.get("model", "Unknown"),
+            inverter_data.get("machine", "Unknown"),
+            inverter_data.get("version"),
+        )
+        if self._device_static.get(serial) == static:
+            return
+
+        self._device_static[serial] = static
+        model, machine, version = static
+        self.device_info_by_serial[serial] = {
+            "identifiers": {(DOMAIN, serial)},
+            "name": f"Solis Inverter {serial[-4:]}",
+            "manufacturer": MANUFACTURER,
+            "model": f"{machine} ({model})",
+            "sw_version": version,
+            "serial_number": serial,
+        }
+
+    async def _async_fetch_station(
+        self, station_id: str
+    ) -> dict[str, Any] | None:
+        """Fetch station details, mapping API errors to a debug log."""
+        try:
+            return await self.api.get_station_details(station_id)
+        except SolisCloudAPIError as err:
+            _LOGGER.debug(
+                "Failed to update station %s details: %s", station_id, err
+            )
+            return None
+
+    async def _async_fetch_inverter(
+        self,
+        serial: str,
+        station_cache: dict[str, asyncio.Task[dict[str, Any] | None]],
+        tg: asyncio.TaskGroup,
+    ) -> dict[str, Any] | None:
+        """Fetch one inverter's detail merged with its station data.
+
+        Station tasks are shared through ``station_cache`` so inverters on the
+        same plant trigger a single stationDetail request per cycle. API
+        failures are logged and reported as None rather than raised, keeping
+        one bad inverter from aborting its siblings in the task group.
+        """
+        try:
+            inverter_data = await self.api.get_inverter_details(serial)
+        except SolisCloudAPIError as err:
+            _LOGGER.warning("Failed to update inverter %s: %s", serial, err)
+            return None
+
+        station_data = None
+        station_id = inverter_data.get("stationId")
+        if station_id not in (None, ""):
+            station_id = str(station_id)
+            if station_id not in station_cache:
+                station_cache[station_id] = tg.create_task(
+                    self._async_fetch_station(station_id)
+                )
+            station_data = await station_cache[station_id]
+
+        return _merge_station_detail(inverter_data, station_data)
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch data from Solis Cloud API."""
         data: dict[str, dict[str, Any]] = {}
-        station_cache: dict[str, dict[str, Any] | None] = {}
+        station_cache: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
+
+        # Leave headroom before the next scheduled cycle so one stuck request
+        # cannot push the whole polling cadence.
+        if self.update_interval is not None:
+            budget = max(self.update_interval.total_seconds() - 5, 10)
+        else:
+            budget = DEFAULT_SCAN_INTERVAL.total_seconds() - 5
 
         try:
-            for serial in self.inverter_serials:
-                try:
-                    inverter_data = await self.api.get_inverter_details(serial)
-                    station_data = None
-                    station_id = inverter_data.get("stationId")
-                    if station_id not in (None, ""):
-                        station_id = str(station_id)
-                        if station_id not in station_cache:
-                            try:
-                                station_cache[station_id] = (
-                                    await self.api.get_station_details(station_id)
-                                )
-                            except SolisCloudAPIError as err:
-                                station_cache[station_id] = None
-                                _LOGGER.debug(
-                                    "Failed to update station %s details: %s",
-                                    station_id,
-                                    err,
-                                )
-                        station_data = station_cache[station_id]
-
-                    inverter_data = _merge_station_detail(inverter_data, station_data)
-                    data[serial] = inverter_data
-
-                    pac_value = inverter_data.get("pac")
-                    try:
-                        pac_float = (
-                            float(pac_value) if pac_value not in (None, "") else None
-                        )
-                    except (TypeError, ValueError):
-                        pac_float = None
-
-                    if pac_float is not None:
-                        _LOGGER.debug(
-                            "Updated data for inverter %s: power=%.2f kW",
-                            serial,
-                            pac_float,
+            async with asyncio.timeout(budget):
+                async with asyncio.TaskGroup() as tg:
+                    tasks = {
+                        serial: tg.create_task(
+                            self._async_fetch_inverter(serial, station_cache, tg)
                         )
-                    else:
-                        _LOGGER.debug("Updated data for inverter %s", serial)
-                except SolisCloudAPIError as err:
-                    _LOGGER.warning("Failed to update inverter %s: %s", serial, err)
-                    continue
-
-            if not data:
-                raise UpdateFailed("Failed to fetch data for any inverter")
-
-            return data
-
-        except SolisCloudAPIError as err:
+                        for serial in self.inverter_serials
+                    }
+        except TimeoutError as err:
             raise UpdateFailed(
-                f"Error communicating with Solis Cloud API: {err}"
+                f"Timed out fetching Solis Cloud data after {budget:.0f}s"
             ) from err
+
+        for serial, task in tasks.items():
+            inverter_data = task.result()
+            if inverter_data is None:
+                continue
+
+            self._backfill_static_fields(serial, inverter_data)
+            inverter_data = self._dedupe_unchanged(serial, inverter_data)
+            data[serial] = inverter_data
+            self._refresh_device_info(serial, inverter_data)
+
+            pac_value = inverter_data.get("pac")
+            try:
+                pac_float = (
+                    float(pac_value) if pac_value not in (None, "") else None
+                )
+            except (TypeError, ValueError):
+                pac_float = None
+
+            if pac_float is not None:
+                _LOGGER.debug(
+                    "Updated data for inverter %s: power=%.2f kW",
+                    serial,
+                    pac_float,
+                )
+            else:
+                _LOGGER.debug("Updated data for inverter %s", serial)
+
+        if not data:
+            raise UpdateFailed("Failed to fetch data for any inverter")
+
+        self._adjust_update_interval(data)
+        return data
@@ -30,13 +30,24 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN, MANUFACTURER
+from .const import ATTRIBUTION, DOMAIN
 from .coordinator import SolisCloudDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 _NIGHT_NOISE_POWER_W = 40.0
 
+# Solis status codes -> stable HA enum values, built once instead of per read.
+_STATE_MAP = {
+    "1": "offline",
+    "2": "standby",
+    "3": "generating",
+}
+_COLLECTOR_STATE_MAP = {
+    "1": "online",
+    "2": "offline",
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class SolisSensorEntityDescription(SensorEntityDescription):
@@ -46,9 +57,12 @@ class SolisSensorEntityDescription(SensorEntityDescription):
 
 
 def _coerce_float(value: Any) -> float | None:
-    """Convert API values to floats when possible."""
-    if value in (None, ""):
-        return None
+    """Convert API values to floats when possible.
+
+    Most payload values are numeric, so try float() directly; None raises
+    TypeError and the empty string raises ValueError, preserving the old
+    null handling without a tuple membership test per call.
+    """
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -345,11 +359,15 @@ def _inverter_state(data: dict[str, Any]) -> str:
     raw = data.get("currentState", data.get("state"))
     if raw in (None, ""):
         return None
-    return {
-        "1": "offline",
-        "2": "standby",
-        "3": "generating",
-    }.get(str(raw), "unknown")
+    return _STATE_MAP.get(str(raw), "unknown")
+
+
+def _collector_state(data: dict[str, Any]) -> str | None:
+    """Map the Solis collector status code to a stable HA enum value."""
+    raw = data.get("collectorState")
+    if raw in (None, ""):
+        return None
+    return _COLLECTOR_STATE_MAP.get(str(raw), "unknown")
 
 
 SENSOR_TYPES: tuple[SolisSensorEntityDescription, ...] = (
@@ -929,13 +947,7 @@ SENSOR_TYPES: tuple[SolisSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         options=["online", "offline", "unknown"],
-        value_fn=lambda data: (
-            None
-            if data.get("collectorState") in (None, "")
-            else {"1": "online", "2": "offline"}.get(
-                str(data.get("collectorState")), "unknown"
-            )
-        ),
+        value_fn=_collector_state,
     ),
 )
 
@@ -950,8 +962,11 @@ async def async_setup_entry(
 
     entities: list[SolisCloudSensor] = []
     for serial in coordinator.inverter_serials:
-        for description in SENSOR_TYPES:
-            entities.append(SolisCloudSensor(coordinator, description, serial))
+        suffix = serial[-4:]
+        entities.extend(
+            SolisCloudSensor(coordinator, description, serial, suffix)
+            for description in SENSOR_TYPES
+        )
 
     async_add_entities(entities)
 
@@ -961,6 +976,11 @@ class SolisCloudSensor(
 ):
     """Representation of a Solis Cloud sensor."""
 
+    # Only the fields this class owns; the HA base classes keep their own
+    # __dict__, but slot storage still gives these hot attributes fixed
+    # offsets and trims per-entity overhead across serials x descriptions.
+    __slots__ = ("_serial_number", "_value_fn", "_cached_data", "_available")
+
     entity_description: SolisSensorEntityDescription
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
@@ -970,49 +990,67 @@ class SolisCloudSensor(
         coordinator: SolisCloudDataUpdateCoordinator,
         description: SolisSensorEntityDescription,
         serial_number: str,
+        serial_suffix: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._serial_number = serial_number
+        # Bind the extractor once; native_value is called for every sensor on
+        # every coordinator push, so skip the dataclass attribute lookup there.
+        self._value_fn = description.value_fn
+        self._refresh_cached_state()
 
-        serial_suffix = serial_number[-4:]
         self._attr_unique_id = f"{serial_number}_{description.key}"
         self._attr_object_id = f"solis_{serial_suffix}_{description.key}"
 
     @property
     def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        if self._serial_number not in self.coordinator.data:
-            return {}
-
-        data = self.coordinator.data[self._serial_number]
-        model = data.get("model", "Unknown")
-        machine = data.get("machine", "Unknown")
-
-        return {
-            "identifiers": {(DOMAIN, self._serial_number)},
-            "name": f"Solis Inverter {self._serial_number[-4:]}",
-            "manufacturer": MANUFACTURER,
-            "model": f"{machine} ({model})",
-            "sw_version": data.get("version"),
-            "serial_number": self._serial_number,
-        }
+        """Return device information, prebuilt by the coordinator."""
+        return self.coordinator.device_info_by_serial.get(self._serial_number, {})
+
+    def _refresh_cached_state(self) -> None:
+        """Recompute the payload reference and availability for this sensor.
+
+        Both only change when the coordinator pushes, so doing this once per
+        push keeps the available property a plain attribute read. The rule is
+        unchanged: unavailable when the last update failed, the inverter is
+        missing from the payload, or the model does not report the field.
+        """
+        data = self.coordinator.data
+        self._cached_data = data.get(self._serial_number) if data else None
+        self._available = (
+            self.coordinator.last_update_success
+            and self._cached_data is not None
+            and self._value_fn(self._cached_data) is not None
+        )
+
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached payload and availability before state writes.
+
+        The coordinator hands back the identical payload object when a cycle
+        produced no changes, so an unchanged reference with unchanged
+        availability means the state cannot have moved — skip the write.
+        """
+        previous_data = self._cached_data
+        previous_available = self._available
+        self._refresh_cached_state()
+        if (
+            self._cached_data is previous_data
+            and self._available == previous_available
+        ):
+            return
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if self._serial_number not in self.coordinator.data:
+        data = self._cached_data
+        if data is None:
             return None
-
-        data = self.coordinator.data[self._serial_number]
-        return self.entity_description.value_fn(data)
+        return self._value_fn(data)
 
     @property
     def available(self) -> bool:
         """Return True when this sensor has data for this inverter/model."""
-        if not self.coordinator.last_update_success:
-            return False
-        if self._serial_number not in self.coordinator.data:
-            return False
-        return self.native_value is not None
+        return self._available
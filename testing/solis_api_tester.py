@@ -5,15 +5,26 @@ Tests various API endpoints to discover available monitoring data for your inver
 """
 
 import asyncio
-import json
+import base64
+import hashlib
+import hmac
 import logging
 import os
 import sys
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+import time
+from email.utils import formatdate
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
-from dotenv import load_dotenv
+import orjson
+
+try:
+    # Optional: stream-parse large list responses instead of buffering them
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +34,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _content_md5(body_bytes: bytes) -> bytes:
+    """Base64 MD5 of a request body.
+
+    Polling sends byte-identical bodies for the list endpoints every cycle,
+    so memoizing the digest skips the MD5 over repeated payloads. Only the
+    Date header and HMAC signature still have to be recomputed per request.
+    """
+    return base64.b64encode(hashlib.md5(body_bytes).digest())
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload, fast-pathing tiny plain-string dicts.
+
+    Most bodies here are one or two short fields like {"sn": ...} or
+    {"id": ...}, which an f-string renders cheaper than a full serializer
+    pass. The ASCII-alphanumeric guard means no JSON escaping can ever be
+    needed on this path; anything else falls back to orjson. The output is
+    byte-identical to orjson's, so the MD5 memo still hits either way.
+    """
+    if len(payload) <= 2 and all(
+        isinstance(key, str) and key.isascii() and key.isalnum()
+        and isinstance(value, str) and value.isascii() and value.isalnum()
+        for key, value in payload.items()
+    ):
+        return (
+            "{" + ",".join(f'"{key}":"{value}"' for key, value in payload.items()) + "}"
+        ).encode('ascii')
+    return orjson.dumps(payload)
+
+
 class SolisCloudAPI:
     """Client for interacting with Solis Cloud API"""
     
@@ -35,39 +77,119 @@ class SolisCloudAPI:
     STATION_DETAIL_ENDPOINT = "/v1/api/stationDetail"
     READ_ENDPOINT = "/v2/api/atRead"
     READ_BATCH_ENDPOINT = "/v2/api/atReadBatch"
+
+    # Constant list payload shared by the list endpoints so each poll reuses
+    # one dict (and, via the MD5 memo, one digest) instead of a fresh literal
+    PAGE_PAYLOAD = {"pageSize": "100"}
+
+    # Inverter/station lists only change when hardware is added, so cache
+    # them for an hour instead of re-fetching every polling cycle
+    LIST_CACHE_TTL = 3600.0
     
-    def __init__(self, api_key: str, api_secret: str, session: aiohttp.ClientSession):
+    def __init__(self, api_key: str, api_secret: str, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key
         self.api_secret = api_secret
+        # Encode the fixed signing secret once instead of per request
+        self._api_secret_bytes = api_secret.encode('utf-8')
         self.session = session
-        
-    def _generate_headers(self, body: str, endpoint: str) -> Dict[str, str]:
+        self._owns_session = session is None
+        # One shared timeout object instead of a fresh one per request, with
+        # tighter connect/read bounds so a stalled phase fails fast rather
+        # than eating the whole 30s total budget
+        self._timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+        # Joined CID strings per requested tuple; a polling caller asks for
+        # the same list every cycle
+        self._cids_str_cache: Dict[Tuple[int, ...], str] = {}
+        # TTL response cache plus per-key locks so concurrent awaiters share
+        # one in-flight request instead of stampeding the API
+        self._cache: Dict[Any, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[Any, asyncio.Lock] = {}
+        # Pre-rendered signature templates: only the MD5 and Date vary per
+        # request, so the verb/content-type/endpoint scaffolding is built
+        # once per endpoint instead of re-joined every call
+        self._sig_templates: Dict[str, str] = {
+            endpoint: "POST\n{md5}\napplication/json\n{date}\n" + endpoint
+            for endpoint in (
+                self.INVERTER_LIST_ENDPOINT,
+                self.INVERTER_DETAIL_ENDPOINT,
+                self.STATION_LIST_ENDPOINT,
+                self.STATION_DETAIL_ENDPOINT,
+                self.READ_ENDPOINT,
+                self.READ_BATCH_ENDPOINT,
+            )
+        }
+
+    async def _cached(self, key: Any, ttl: float, coro_factory) -> Any:
+        """Return a cached response, refreshing it at most once per TTL.
+
+        Failed fetches (None) are not cached, so the next caller retries.
+        """
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another awaiter may have refreshed the entry while we waited
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry and entry[0] > now:
+                return entry[1]
+
+            value = await coro_factory()
+            if value is not None:
+                self._cache[key] = (now + ttl, value)
+            return value
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client session, lazily creating a persistent one.
+
+        When no session is supplied, build one with a keep-alive tuned
+        connector so repeated polls reuse the established TLS connection
+        instead of paying the full handshake per call.
+        """
+        if self._owns_session and (self.session is None or self.session.closed):
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=4,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                )
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the session if this client owns it"""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _generate_headers(self, body: bytes, endpoint: str) -> Dict[str, str]:
         """Generate authentication headers for API requests"""
-        import hashlib
-        import hmac
-        import base64
-        
-        # Create MD5 hash of body
-        content_md5 = base64.b64encode(hashlib.md5(body.encode('utf-8')).digest()).decode('utf-8')
-        
-        # Create signature
+        # MD5 of the serialized body, memoized across identical payloads
+        content_md5 = _content_md5(body).decode('ascii')
+
+        # Create signature (formatdate emits the same RFC 1123 GMT string
+        # without building a datetime or going through strftime)
         content_type = "application/json"
-        date = datetime.now(UTC).strftime("%a, %d %b %Y %H:%M:%S GMT")
-        
-        # Authorization string per Solis API spec
-        string_to_sign = f"POST\n{content_md5}\n{content_type}\n{date}\n{endpoint}"
-        
+        date = formatdate(usegmt=True)
+
+        # Fill the per-endpoint template, then encode once for the HMAC
+        template = self._sig_templates.get(endpoint)
+        if template is None:
+            template = self._sig_templates[endpoint] = (
+                "POST\n{md5}\napplication/json\n{date}\n" + endpoint
+            )
+        string_to_sign = template.format(md5=content_md5, date=date).encode('utf-8')
+
         # HMAC-SHA1 signature
         signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode('utf-8'),
-                string_to_sign.encode('utf-8'),
-                hashlib.sha1
-            ).digest()
+            hmac.new(self._api_secret_bytes, string_to_sign, hashlib.sha1).digest()
         ).decode('utf-8')
-        
+
         authorization = f"API {self.api_key}:{signature}"
-        
+
         return {
             "Content-Type": content_type,
             "Content-MD5": content_md5,
@@ -78,18 +200,22 @@ class SolisCloudAPI:
     async def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Make authenticated API request"""
         url = f"{self.BASE_URL}{endpoint}"
-        body = json.dumps(payload)
+        # orjson serializes straight to bytes, feeding the MD5 header and
+        # aiohttp without another encode pass
+        body = _dumps_payload(payload)
         headers = self._generate_headers(body, endpoint)
-        
+
         try:
-            async with self.session.post(url, headers=headers, data=body, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                response_text = await response.text()
-                
+            async with self._get_session().post(url, headers=headers, data=body, timeout=self._timeout) as response:
+                # Read raw bytes; orjson parses them directly, so the UTF-8
+                # decode is only paid on the error-logging path
+                raw = await response.read()
+
                 if response.status != 200:
-                    logger.error(f"HTTP error {response.status}: {response_text}")
+                    logger.error(f"HTTP error {response.status}: {raw.decode('utf-8', errors='replace')}")
                     return None
-                
-                result = json.loads(response_text)
+
+                result = orjson.loads(raw)
                 
                 # Check API response code
                 if result.get("code") != "0":
@@ -102,14 +228,72 @@ class SolisCloudAPI:
             logger.error(f"Request failed: {e}")
             return None
     
+    async def _stream_records(self, endpoint: str, payload: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a paged list response, stream-parsing the records array.
+
+        Accounts with many inverters/stations can return large records
+        arrays; feeding the aiohttp body stream straight into ijson keeps
+        peak memory flat instead of holding the raw text plus a fully parsed
+        document. Falls back to the buffered _make_request path (including
+        its API error-code check) when ijson is not installed.
+        """
+        if ijson is None:
+            data = await self._make_request(endpoint, payload)
+            if data and "page" in data and "records" in data["page"]:
+                return data["page"]["records"]
+            return None
+
+        url = f"{self.BASE_URL}{endpoint}"
+        body = _dumps_payload(payload)
+        headers = self._generate_headers(body, endpoint)
+
+        try:
+            async with self._get_session().post(url, headers=headers, data=body, timeout=self._timeout) as response:
+                if response.status != 200:
+                    logger.error(f"HTTP error {response.status}: {await response.text()}")
+                    return None
+
+                # Walk the event stream once, building records one at a time
+                # while also capturing the top-level code/msg fields, so an
+                # API-level error is reported instead of masquerading as an
+                # empty (and cacheable) list
+                records: List[Dict[str, Any]] = []
+                code = None
+                msg = None
+                builder = None
+                async for prefix, event, value in ijson.parse(response.content):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "data.page.records.item" and event == "end_map":
+                            records.append(builder.value)
+                            builder = None
+                    elif prefix == "data.page.records.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "code":
+                        code = value
+                    elif prefix == "msg":
+                        msg = value
+
+                # Check API response code
+                if code != "0":
+                    logger.error(f"API error - Code: {code}, Message: {msg}")
+                    return None
+
+                return records
+
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            return None
+
     async def get_inverter_list(self) -> Optional[List[Dict[str, Any]]]:
         """Get list of all inverters on the account"""
         logger.info("Fetching inverter list...")
-        data = await self._make_request(self.INVERTER_LIST_ENDPOINT, {"pageSize": "100"})
-        
-        if data and "page" in data and "records" in data["page"]:
-            return data["page"]["records"]
-        return None
+        return await self._cached(
+            ("inverterList",),
+            self.LIST_CACHE_TTL,
+            lambda: self._stream_records(self.INVERTER_LIST_ENDPOINT, self.PAGE_PAYLOAD),
+        )
     
     async def get_inverter_details(self, inverter_sn: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific inverter"""
@@ -119,11 +303,11 @@ class SolisCloudAPI:
     async def get_station_list(self) -> Optional[List[Dict[str, Any]]]:
         """Get list of all stations on the account"""
         logger.info("Fetching station list...")
-        data = await self._make_request(self.STATION_LIST_ENDPOINT, {"pageSize": "100"})
-        
-        if data and "page" in data and "records" in data["page"]:
-            return data["page"]["records"]
-        return None
+        return await self._cached(
+            ("stationList",),
+            self.LIST_CACHE_TTL,
+            lambda: self._stream_records(self.STATION_LIST_ENDPOINT, self.PAGE_PAYLOAD),
+        )
     
     async def get_station_detail(self, station_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific station"""
@@ -142,21 +326,81 @@ class SolisCloudAPI:
     async def read_cids_batch(self, inverter_sn: str, cids: List[int]) -> Optional[Dict[int, str]]:
         """Read multiple CID values at once"""
         logger.info(f"Reading {len(cids)} CIDs from inverter {inverter_sn}...")
+        key = tuple(cids)
+        cids_str = self._cids_str_cache.get(key)
+        if cids_str is None:
+            cids_str = self._cids_str_cache[key] = ",".join(map(str, cids))
+
         data = await self._make_request(
-            self.READ_BATCH_ENDPOINT, 
-            {"inverterSn": inverter_sn, "cids": ",".join(map(str, cids))}
+            self.READ_BATCH_ENDPOINT,
+            {"inverterSn": inverter_sn, "cids": cids_str}
         )
-        
+
         if data and isinstance(data, list):
-            result = {}
-            for outer_item in data:
-                if isinstance(outer_item, list):
-                    for item in outer_item:
-                        if "cid" in item and "msg" in item:
-                            result[int(item["cid"])] = item["msg"]
-            return result
+            # The endpoint returns a list of row lists; chain flattens it at
+            # C speed so one dict comprehension replaces the nested loops.
+            # Non-list rows (e.g. a null element) are skipped, as before.
+            return {
+                int(item["cid"]): item["msg"]
+                for item in chain.from_iterable(
+                    row for row in data if isinstance(row, list)
+                )
+                if "cid" in item and "msg" in item
+            }
         return None
 
+    async def read_cids(
+        self, inverter_sn: str, cids: List[int], chunk: int = 64
+    ) -> Optional[Dict[int, str]]:
+        """Read any number of CIDs, fanning out batch requests concurrently.
+
+        The batch endpoint caps how many CIDs one call accepts, so the list
+        is split into ``chunk``-sized slices fetched in parallel and the
+        per-batch dicts merged. Returns None only if every batch failed.
+        """
+        batches = [cids[i:i + chunk] for i in range(0, len(cids), chunk)]
+        results = await asyncio.gather(
+            *(self.read_cids_batch(inverter_sn, batch) for batch in batches)
+        )
+
+        merged: Dict[int, str] = {}
+        for batch_result in results:
+            if batch_result:
+                merged.update(batch_result)
+        return merged if merged else None
+
+
+# Device-info labels and the payload fields backing them
+_DEVICE_INFO_FIELDS = (
+    ("Model", "model"),
+    ("Machine", "machine"),
+    ("Serial Number", "sn"),
+    ("Firmware Version", "version"),
+)
+
+# Home Assistant sensor map, flattened to one row per sensor:
+# (section, description, payload field, unit payload field or None,
+#  default unit, ha_device_class, ha_state_class)
+# The strings are constants, so building this once at import avoids
+# reassembling ~80 nested dict/str literals on every run.
+_SENSOR_SPEC = (
+    ("POWER SENSORS (Real-time)", "Current AC Power Output", "pac", None, "kW", "power", "measurement"),
+    ("POWER SENSORS (Real-time)", "Current DC Power Input", "dcPac", None, "kW", "power", "measurement"),
+    ("ENERGY SENSORS (For HA Energy Dashboard)", "Solar Production Today", "eToday", "eTodayStr", "kWh", "energy", "total_increasing"),
+    ("ENERGY SENSORS (For HA Energy Dashboard)", "Solar Production This Month", "eMonth", "eMonthStr", "kWh", "energy", "total_increasing"),
+    ("ENERGY SENSORS (For HA Energy Dashboard)", "Solar Production This Year", "eYear", "eYearStr", "MWh", "energy", "total_increasing"),
+    ("ENERGY SENSORS (For HA Energy Dashboard)", "Total Solar Production (Lifetime)", "eTotal", "eTotalStr", "MWh", "energy", "total_increasing"),
+    ("PV STRING MONITORING", "PV String 1 Voltage", "uPv1", None, "V", "voltage", "measurement"),
+    ("PV STRING MONITORING", "PV String 1 Current", "iPv1", None, "A", "current", "measurement"),
+    ("PV STRING MONITORING", "PV String 1 Power", "pow1", None, "W", "power", "measurement"),
+    ("GRID MONITORING", "Grid Voltage", "uAc1", None, "V", "voltage", "measurement"),
+    ("GRID MONITORING", "Grid Current", "iAc1", None, "A", "current", "measurement"),
+    ("GRID MONITORING", "Grid Frequency", "fac", None, "Hz", "frequency", "measurement"),
+    ("STATUS & DIAGNOSTICS", "Inverter Status (1=Offline, 2=Standby, 3=Generating)", "currentState", None, "", "enum", None),
+    ("STATUS & DIAGNOSTICS", "Inverter Temperature", "inverterTemperature", None, "°C", "temperature", "measurement"),
+    ("STATUS & DIAGNOSTICS", "Generation Hours Today", "fullHour", None, "h", "duration", "total_increasing"),
+)
+
 
 def print_section(title: str):
     """Print a formatted section header"""
@@ -165,24 +409,35 @@ def print_section(title: str):
     print("=" * 80)
 
 
-def print_json(data: Any, indent: int = 2):
+def print_json(data: Any) -> None:
     """Pretty print JSON data"""
-    print(json.dumps(data, indent=indent, ensure_ascii=False))
+    # orjson emits UTF-8 bytes directly; write them without a str round-trip
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
 
 
 def print_flat_stats(data: Dict[str, Any]) -> None:
     """Print every key/value pair available in the inverter payload."""
     print_section("ALL INVERTER FIELDS (SORTED)")
-    for key in sorted(data.keys()):
-        print(f"{key}: {data[key]}")
+    # Build one buffer and write it in a single call instead of issuing a
+    # line-buffered print() (and its flush) per field; sorting the items
+    # directly skips the per-key dict lookup in the loop
+    sys.stdout.write(
+        "\n".join(f"{key}: {value}" for key, value in sorted(data.items())) + "\n"
+    )
 
 
 async def test_monitoring_endpoints(api: SolisCloudAPI, inverter_sn: Optional[str] = None):
     """Test and extract Home Assistant energy dashboard relevant data"""
     
-    # Get Inverter List
+    # Phase 1: the account-level lists are independent, so fetch them
+    # concurrently and pay one round-trip instead of two. The client logs
+    # failures internally and returns None rather than raising.
     print_section("DETECTING INVERTER")
-    inverters = await api.get_inverter_list()
+    inverters, stations = await asyncio.gather(
+        api.get_inverter_list(),
+        api.get_station_list(),
+    )
+
     if inverters:
         if not inverter_sn and inverters:
             inverter_sn = inverters[0].get("sn")
@@ -190,168 +445,49 @@ async def test_monitoring_endpoints(api: SolisCloudAPI, inverter_sn: Optional[st
     else:
         print("No inverters found")
         return
-    
+
+    if stations:
+        print(f"Found {len(stations)} station(s)")
+
     if not inverter_sn:
         print("No inverter serial number available")
         return
-    
-    # Get Inverter Details
+
+    # Phase 2: once the serial is known, the per-device detail fetches are
+    # independent of each other as well
     print_section("HOME ASSISTANT ENERGY DASHBOARD - SOLAR PRODUCTION SENSORS")
-    inverter_details = await api.get_inverter_details(inverter_sn)
-    
+    station_id = stations[0].get("id") if stations else None
+    if station_id is not None:
+        inverter_details, station_details = await asyncio.gather(
+            api.get_inverter_details(inverter_sn),
+            api.get_station_detail(str(station_id)),
+        )
+    else:
+        inverter_details = await api.get_inverter_details(inverter_sn)
+        station_details = None
+
     if not inverter_details:
         print("Failed to fetch inverter details")
         return
+
+    if station_details:
+        print(f"Station detail available for station {station_id}")
     
-    # Extract HA Energy Dashboard relevant data
-    solar_data = {
-        "device_info": {
-            "model": inverter_details.get("model"),
-            "machine": inverter_details.get("machine"),
-            "serial_number": inverter_details.get("sn"),
-            "firmware_version": inverter_details.get("version"),
-        },
-        "power_sensors": {
-            "current_power": {
-                "value": inverter_details.get("pac"),
-                "unit": "kW",
-                "description": "Current AC Power Output",
-                "ha_device_class": "power",
-                "ha_state_class": "measurement"
-            },
-            "dc_power": {
-                "value": inverter_details.get("dcPac"),
-                "unit": "kW", 
-                "description": "Current DC Power Input",
-                "ha_device_class": "power",
-                "ha_state_class": "measurement"
-            }
-        },
-        "energy_sensors": {
-            "energy_today": {
-                "value": inverter_details.get("eToday"),
-                "unit": inverter_details.get("eTodayStr", "kWh"),
-                "description": "Solar Production Today",
-                "ha_device_class": "energy",
-                "ha_state_class": "total_increasing"
-            },
-            "energy_month": {
-                "value": inverter_details.get("eMonth"),
-                "unit": inverter_details.get("eMonthStr", "kWh"),
-                "description": "Solar Production This Month",
-                "ha_device_class": "energy",
-                "ha_state_class": "total_increasing"
-            },
-            "energy_year": {
-                "value": inverter_details.get("eYear"),
-                "unit": inverter_details.get("eYearStr", "MWh"),
-                "description": "Solar Production This Year",
-                "ha_device_class": "energy",
-                "ha_state_class": "total_increasing"
-            },
-            "energy_total": {
-                "value": inverter_details.get("eTotal"),
-                "unit": inverter_details.get("eTotalStr", "MWh"),
-                "description": "Total Solar Production (Lifetime)",
-                "ha_device_class": "energy",
-                "ha_state_class": "total_increasing"
-            }
-        },
-        "string_monitoring": {
-            "pv1_voltage": {
-                "value": inverter_details.get("uPv1"),
-                "unit": "V",
-                "description": "PV String 1 Voltage",
-                "ha_device_class": "voltage",
-                "ha_state_class": "measurement"
-            },
-            "pv1_current": {
-                "value": inverter_details.get("iPv1"),
-                "unit": "A",
-                "description": "PV String 1 Current",
-                "ha_device_class": "current",
-                "ha_state_class": "measurement"
-            },
-            "pv1_power": {
-                "value": inverter_details.get("pow1"),
-                "unit": "W",
-                "description": "PV String 1 Power",
-                "ha_device_class": "power",
-                "ha_state_class": "measurement"
-            }
-        },
-        "grid_monitoring": {
-            "grid_voltage": {
-                "value": inverter_details.get("uAc1"),
-                "unit": "V",
-                "description": "Grid Voltage",
-                "ha_device_class": "voltage",
-                "ha_state_class": "measurement"
-            },
-            "grid_current": {
-                "value": inverter_details.get("iAc1"),
-                "unit": "A",
-                "description": "Grid Current",
-                "ha_device_class": "current",
-                "ha_state_class": "measurement"
-            },
-            "grid_frequency": {
-                "value": inverter_details.get("fac"),
-                "unit": "Hz",
-                "description": "Grid Frequency",
-                "ha_device_class": "frequency",
-                "ha_state_class": "measurement"
-            }
-        },
-        "status_sensors": {
-            "inverter_state": {
-                "value": inverter_details.get("currentState"),
-                "description": "Inverter Status (1=Offline, 2=Standby, 3=Generating)",
-                "ha_device_class": "enum"
-            },
-            "inverter_temperature": {
-                "value": inverter_details.get("inverterTemperature"),
-                "unit": "°C",
-                "description": "Inverter Temperature",
-                "ha_device_class": "temperature",
-                "ha_state_class": "measurement"
-            },
-            "daily_runtime": {
-                "value": inverter_details.get("fullHour"),
-                "unit": "h",
-                "description": "Generation Hours Today",
-                "ha_device_class": "duration",
-                "ha_state_class": "total_increasing"
-            }
-        }
-    }
-    
-    # Display formatted output
+    # Display formatted output from the static sensor spec; only the values
+    # (and *Str units) come from the payload
     print("\nDEVICE INFORMATION:")
-    for key, value in solar_data["device_info"].items():
-        print(f"   {key.replace('_', ' ').title()}: {value}")
-    
-    print("\nPOWER SENSORS (Real-time):")
-    for sensor_name, sensor_data in solar_data["power_sensors"].items():
-        print(f"   {sensor_data['description']}: {sensor_data['value']} {sensor_data['unit']}")
-    
-    print("\nENERGY SENSORS (For HA Energy Dashboard):")
-    for sensor_name, sensor_data in solar_data["energy_sensors"].items():
-        print(f"   {sensor_data['description']}: {sensor_data['value']} {sensor_data['unit']}")
-    
-    print("\nPV STRING MONITORING:")
-    for sensor_name, sensor_data in solar_data["string_monitoring"].items():
-        print(f"   {sensor_data['description']}: {sensor_data['value']} {sensor_data['unit']}")
-    
-    print("\nGRID MONITORING:")
-    for sensor_name, sensor_data in solar_data["grid_monitoring"].items():
-        print(f"   {sensor_data['description']}: {sensor_data['value']} {sensor_data['unit']}")
-    
-    print("\nSTATUS & DIAGNOSTICS:")
-    for sensor_name, sensor_data in solar_data["status_sensors"].items():
-        unit = f" {sensor_data['unit']}" if 'unit' in sensor_data else ""
-        print(f"   {sensor_data['description']}: {sensor_data['value']}{unit}")
-    
+    for label, field in _DEVICE_INFO_FIELDS:
+        print(f"   {label}: {inverter_details.get(field)}")
+
+    section = None
+    for sec, description, field, unit_field, default_unit, _dc, _sc in _SENSOR_SPEC:
+        if sec != section:
+            section = sec
+            print(f"\n{sec}:")
+        unit = inverter_details.get(unit_field, default_unit) if unit_field else default_unit
+        suffix = f" {unit}" if unit else ""
+        print(f"   {description}: {inverter_details.get(field)}{suffix}")
+
     print_flat_stats(inverter_details)
 
     print("\n" + "=" * 80)
@@ -366,6 +502,10 @@ async def test_monitoring_endpoints(api: SolisCloudAPI, inverter_sn: Optional[st
 
 async def main():
     """Main entry point"""
+    # dotenv is only needed here, so import it at the entry point rather
+    # than paying for it whenever the module is imported
+    from dotenv import load_dotenv
+
     # Load environment variables
     load_dotenv()
     
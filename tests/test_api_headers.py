@@ -0,0 +1,61 @@
+"""Regression tests for the Solis Cloud request signing path."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Import the api module without executing the Home Assistant integration
+# package __init__, which needs a full Home Assistant runtime.
+pkg = types.ModuleType("custom_components.solis_cloud_monitoring")
+pkg.__path__ = [
+    str(
+        Path(__file__).resolve().parents[1]
+        / "custom_components"
+        / "solis_cloud_monitoring"
+    )
+]
+sys.modules.setdefault("custom_components.solis_cloud_monitoring", pkg)
+
+import orjson
+
+from custom_components.solis_cloud_monitoring.api import SolisCloudAPI
+from custom_components.solis_cloud_monitoring.const import API_INVERTER_DETAIL
+
+
+def test_content_md5_uses_fips_permitted_digest():
+    """The Content-MD5 header must come from the usedforsecurity=False path."""
+    api = SolisCloudAPI("key", "secret", object())
+    body = orjson.dumps({"sn": "ABC123"})
+
+    headers = api._generate_headers(body, API_INVERTER_DETAIL)
+
+    expected = base64.b64encode(
+        hashlib.md5(body, usedforsecurity=False).digest()
+    ).decode("utf-8")
+    assert headers["Content-MD5"] == expected
+
+
+def test_signature_matches_solis_spec_reference():
+    """The bytes-based signing path must match a straight str reference."""
+    api = SolisCloudAPI("key", "secret", object())
+    body = orjson.dumps({"pageSize": "100"})
+
+    headers = api._generate_headers(body, "/v1/api/inverterList")
+
+    string_to_sign = (
+        f"POST\n{headers['Content-MD5']}\napplication/json\n"
+        f"{headers['Date']}\n/v1/api/inverterList"
+    )
+    expected = base64.b64encode(
+        hmac.new(
+            b"secret", string_to_sign.encode("utf-8"), hashlib.sha1
+        ).digest()
+    ).decode("utf-8")
+    assert headers["Authorization"] == f"API key:{expected}"
+    assert headers["Date"].endswith("GMT")